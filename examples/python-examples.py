@@ -5,32 +5,203 @@ These examples demonstrate how to use the MCP Server Trello
 with Python applications.
 """
 
+import asyncio
+import concurrent.futures
 import json
-from datetime import datetime, timedelta
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
 
 
+# Story points prefix in card names, e.g. "[5] Feature Name"
+_POINTS_RE = re.compile(r'^\[(\d+)\]')
+
+# Lists whose cards count as completed work
+_DONE_LISTS = frozenset({'Done', 'Completed', 'Deployed'})
+
+# Lists checked, in order, for the sprint's finished cards in velocity reports.
+# A subset of _DONE_LISTS: the report reads a single list, so it excludes
+# 'Deployed' to avoid picking a release column over the sprint's Done column
+_VELOCITY_DONE_LISTS = ('Done', 'Completed')
+
+
+# Description templates, filled with str.format
+_TASK_DESC_TMPL = """## Task Details
+
+**Priority**: {prio_upper}
+**Assigned to**: {assignee}
+**Created**: {created}
+
+### Description
+{description}
+
+### Metadata
+- Priority Level: {prio}
+- Due Date: {due}
+- Labels: {labels}
+"""
+
+_WIP_VIOLATION_TMPL = """## WIP Limit Violation
+
+The **{stage}** column has exceeded its WIP limit.
+
+- **Current cards**: {count}
+- **WIP Limit**: {limit}
+- **Excess**: {excess}
+
+### Action Required
+Please complete work in progress before pulling new items."""
+
+# Card fields the analytics need; skipping descriptions keeps large lists small
+_ANALYTICS_CARD_FIELDS = 'name,labels,due,dueComplete,dateLastActivity'
+
+
+def _parse_trello_ts(s: str) -> datetime:
+    """Parse a Trello timestamp, fast-pathing the usual YYYY-MM-DDTHH:MM:SS.sssZ form."""
+    if len(s) == 24 and s[-1] == 'Z':
+        return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                        int(s[11:13]), int(s[14:16]), int(s[17:19]),
+                        int(s[20:23]) * 1000, tzinfo=timezone.utc)
+    return datetime.fromisoformat(s.replace('Z', '+00:00'))
+
+
+def _story_points(card: Dict) -> int:
+    """Return the story points encoded in a card name, or 0 if there are none."""
+    points_match = _POINTS_RE.match(card.get('name') or '')
+    return int(points_match.group(1)) if points_match else 0
+
+
 # Example 1: Basic MCP Client Wrapper
 class TrelloMCPClient:
     """Wrapper for MCP Server Trello interactions."""
 
+    # Tools that change the board's lists and so invalidate the cached get_lists
+    LIST_MUTATING_TOOLS = {
+        'add_list_to_board',
+        'archive_list',
+        'update_list',
+        'update_list_position',
+        'set_active_board'
+    }
+
     def __init__(self, server_name: str = 'trello'):
         self.server_name = server_name
+        self._lists_cache = None
+        self._lists_cache_ts = 0.0
+        # Bumped after every list mutation so in-flight fetches can detect staleness
+        self._lists_generation = 0
 
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any] = None) -> Dict:
         """
         Call an MCP tool with the given arguments.
         This would be replaced with your actual MCP client implementation.
         """
-        # Placeholder for actual MCP client call
-        # In practice, you would use an MCP client library
-        return await use_mcp_tool({
-            'server_name': self.server_name,
-            'tool_name': tool_name,
-            'arguments': arguments or {}
-        })
+        try:
+            # Placeholder for actual MCP client call
+            # In practice, you would use an MCP client library and open one session
+            # for the lifetime of this client, so concurrent calls share it rather
+            # than reconnecting (or respawning the stdio server) on every call
+            return await use_mcp_tool({
+                'server_name': self.server_name,
+                'tool_name': tool_name,
+                'arguments': arguments or {}
+            })
+        finally:
+            # Invalidate only once the mutation has finished
+            if tool_name in self.LIST_MUTATING_TOOLS:
+                self._lists_generation += 1
+                self._lists_cache = None
+
+    async def aclose(self):
+        """Release the client's session and cached state."""
+        # Close the long-lived MCP session here when using a real client library
+        self._lists_cache = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def get_list_cards(self, list_id: str, fields: Optional[str] = None) -> List[Dict]:
+        """Fetch a list's cards, optionally trimmed to a comma-separated field set."""
+        arguments = {'listId': list_id}
+        if fields:
+            arguments['fields'] = fields
+        return await self.call_tool('get_cards_by_list_id', arguments)
+
+    async def get_lists_cached(self, ttl: float = 30) -> List[Dict]:
+        """Return get_lists, reusing the previous result for up to `ttl` seconds."""
+        now = time.monotonic()
+        if self._lists_cache is not None and now - self._lists_cache_ts <= ttl:
+            return self._lists_cache
+
+        generation = self._lists_generation
+        lists = await self.call_tool('get_lists')
+        # Don't cache a result that a list mutation may have overtaken
+        if generation == self._lists_generation:
+            self._lists_cache = lists
+            self._lists_cache_ts = now
+        return lists
+
+
+class AsyncLoopThread:
+    """Runs one persistent asyncio event loop in a background thread."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """Schedule a coroutine on the loop from any thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+
+_loop_thread: Optional[AsyncLoopThread] = None
+_loop_thread_lock = threading.Lock()
+
+
+def _shared_loop_thread() -> AsyncLoopThread:
+    """Return the process-wide loop thread, starting it on first use."""
+    global _loop_thread
+    with _loop_thread_lock:
+        if _loop_thread is None:
+            _loop_thread = AsyncLoopThread()
+        return _loop_thread
+
+
+class TrelloMCPClientSync:
+    """Blocking wrapper around TrelloMCPClient for synchronous callers."""
+
+    def __init__(self, server_name: str = 'trello',
+                 loop_thread: Optional[AsyncLoopThread] = None):
+        self._async = TrelloMCPClient(server_name)
+        self._loop_thread = loop_thread or _shared_loop_thread()
+
+    def call_tool_sync(self, tool_name: str, arguments: Dict[str, Any] = None) -> Dict:
+        """Call an MCP tool on the shared loop and wait for its result."""
+        return self._loop_thread.submit(
+            self._async.call_tool(tool_name, arguments)
+        ).result()
+
+    def close(self):
+        """Close the underlying client on the shared loop."""
+        self._loop_thread.submit(self._async.aclose()).result()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
 
 # Example 2: Task Priority System
@@ -42,6 +213,19 @@ class Priority(Enum):
     LOW = "low"
 
 
+# Priority lookup by label name
+_PRIORITY_VALUES = {p.value: p for p in Priority}
+
+
+def _label_name(label) -> str:
+    """Return a label's name, whether given as a Trello label dict or a plain string."""
+    return label.get('name', '') if isinstance(label, dict) else label
+
+
+# Board list name for each priority
+_PRIORITY_LIST_NAME = {p: f"Priority: {p.value.capitalize()}" for p in Priority}
+
+
 @dataclass
 class Task:
     """Represents a Trello task."""
@@ -57,6 +241,13 @@ class Task:
 class TaskManager:
     """Manages tasks in Trello with priority-based workflows."""
 
+    # Next priority up for escalation; CRITICAL has no successor
+    _NEXT_PRIORITY = {
+        Priority.LOW: Priority.MEDIUM,
+        Priority.MEDIUM: Priority.HIGH,
+        Priority.HIGH: Priority.CRITICAL
+    }
+
     def __init__(self, trello_client: TrelloMCPClient):
         self.trello = trello_client
         self.priority_lists = {}
@@ -64,24 +255,29 @@ class TaskManager:
     async def initialize_priority_lists(self):
         """Create lists for each priority level if they don't exist."""
         lists = await self.trello.call_tool('get_lists')
-        existing_list_names = {lst['name'] for lst in lists}
+        name_to_id = {lst['name']: lst['id'] for lst in lists}
 
+        # Resolve the IDs of priority lists that already exist
+        missing = []
         for priority in Priority:
-            list_name = f"Priority: {priority.value.capitalize()}"
-            if list_name not in existing_list_names:
-                new_list = await self.trello.call_tool('add_list_to_board', {
-                    'name': list_name
-                })
-                self.priority_lists[priority] = new_list['id']
+            list_name = _PRIORITY_LIST_NAME[priority]
+            if list_name in name_to_id:
+                self.priority_lists[priority] = name_to_id[list_name]
             else:
-                # Find the existing list ID
-                for lst in lists:
-                    if lst['name'] == list_name:
-                        self.priority_lists[priority] = lst['id']
-                        break
+                missing.append(priority)
+
+        # Create the missing lists one at a time: each new list is appended to
+        # the board, so sequential creation keeps them in Critical -> Low order
+        for priority in missing:
+            new_list = await self.trello.call_tool('add_list_to_board', {
+                'name': _PRIORITY_LIST_NAME[priority]
+            })
+            self.priority_lists[priority] = new_list['id']
 
     async def create_task(self, task: Task) -> Dict:
         """Create a task card in the appropriate priority list."""
+        now = datetime.now()
+
         # Calculate due date based on priority if not specified
         if not task.due_date:
             days_by_priority = {
@@ -90,43 +286,46 @@ class TaskManager:
                 Priority.MEDIUM: 7,
                 Priority.LOW: 14
             }
-            task.due_date = datetime.now() + timedelta(days=days_by_priority[task.priority])
+            task.due_date = now + timedelta(days=days_by_priority[task.priority])
 
         # Create the card
         card = await self.trello.call_tool('add_card_to_list', {
             'listId': self.priority_lists[task.priority],
             'name': task.name,
-            'description': self._format_task_description(task),
+            'description': self._format_task_description(task, now),
             'dueDate': task.due_date.isoformat(),
             'labels': task.labels or [task.priority.value]
         })
 
-        # Add checklist items if provided
+        # Add checklist items if provided, in order: the server appends each
+        # item as it arrives and takes no position argument
         if task.checklist_items:
+            # Items are looked up by checklist name on this card, so create it first
+            await self.trello.call_tool('create_checklist', {
+                'name': 'Task Checklist',
+                'cardId': card['id']
+            })
             for item in task.checklist_items:
                 await self.trello.call_tool('add_checklist_item', {
                     'text': item,
-                    'checkListName': 'Task Checklist'
+                    'checkListName': 'Task Checklist',
+                    'cardId': card['id']
                 })
 
         return card
 
-    def _format_task_description(self, task: Task) -> str:
+    def _format_task_description(self, task: Task,
+                                 created: Optional[datetime] = None) -> str:
         """Format task description with metadata."""
-        return f"""## Task Details
-
-**Priority**: {task.priority.value.upper()}
-**Assigned to**: {task.assignee or 'Unassigned'}
-**Created**: {datetime.now().isoformat()}
-
-### Description
-{task.description}
-
-### Metadata
-- Priority Level: {task.priority.value}
-- Due Date: {task.due_date.strftime('%Y-%m-%d %H:%M') if task.due_date else 'Not set'}
-- Labels: {', '.join(task.labels) if task.labels else 'None'}
-"""
+        return _TASK_DESC_TMPL.format(
+            prio_upper=task.priority.value.upper(),
+            assignee=task.assignee or 'Unassigned',
+            created=(created or datetime.now()).isoformat(),
+            description=task.description,
+            prio=task.priority.value,
+            due=task.due_date.strftime('%Y-%m-%d %H:%M') if task.due_date else 'Not set',
+            labels=', '.join(task.labels) if task.labels else 'None'
+        )
 
     async def escalate_task(self, card_id: str, reason: str):
         """Escalate a task to a higher priority."""
@@ -138,48 +337,49 @@ class TaskManager:
         # Determine new priority
         current_priority = None
         for label in card.get('labels', []):
-            try:
-                current_priority = Priority(label.get('name', label))
+            name = _label_name(label)
+            if name in _PRIORITY_VALUES:
+                current_priority = _PRIORITY_VALUES[name]
                 break
-            except ValueError:
-                continue
 
-        if current_priority == Priority.CRITICAL:
-            print("Task is already at highest priority")
+        if current_priority is None:
+            print("Task has no priority label to escalate from")
             return
 
         # Map to next higher priority
-        priority_order = [Priority.LOW, Priority.MEDIUM, Priority.HIGH, Priority.CRITICAL]
-        current_index = priority_order.index(current_priority)
-        new_priority = priority_order[current_index + 1]
-
-        # Move to new priority list
-        await self.trello.call_tool('move_card', {
-            'cardId': card_id,
-            'listId': self.priority_lists[new_priority]
-        })
+        new_priority = self._NEXT_PRIORITY.get(current_priority)
+        if new_priority is None:
+            print("Task is already at highest priority")
+            return
 
         # Update labels
         new_labels = [label for label in card.get('labels', [])
-                      if label.get('name', label) != current_priority.value]
+                      if _label_name(label) != current_priority.value]
         new_labels.append(new_priority.value)
 
-        await self.trello.call_tool('update_card_details', {
-            'cardId': card_id,
-            'labels': new_labels
-        })
-
-        # Add escalation comment
-        await self.trello.call_tool('add_comment', {
-            'cardId': card_id,
-            'text': f"""⚠️ **Task Escalated**
+        # Move, relabel and comment are independent, so run them together
+        await asyncio.gather(
+            # Move to new priority list
+            self.trello.call_tool('move_card', {
+                'cardId': card_id,
+                'listId': self.priority_lists[new_priority]
+            }),
+            self.trello.call_tool('update_card_details', {
+                'cardId': card_id,
+                'labels': new_labels
+            }),
+            # Add escalation comment
+            self.trello.call_tool('add_comment', {
+                'cardId': card_id,
+                'text': f"""⚠️ **Task Escalated**
 
 **From**: {current_priority.value.upper()}
 **To**: {new_priority.value.upper()}
 **Reason**: {reason}
 **Escalated by**: System
 **Time**: {datetime.now().isoformat()}"""
-        })
+            })
+        )
 
 
 # Example 3: Kanban Board Automation
@@ -200,6 +400,7 @@ class KanbanAutomation:
 
     async def setup_kanban_board(self):
         """Set up a standard Kanban board structure."""
+        # Lists are appended in creation order, so create them one at a time
         for stage in self.workflow_stages:
             list_data = await self.trello.call_tool('add_list_to_board', {
                 'name': stage
@@ -246,8 +447,8 @@ class KanbanAutomation:
         current_stage = card.get('list', {}).get('name')
 
         # Simple cycle time calculation
-        created_date = datetime.fromisoformat(card.get('dateLastActivity', datetime.now().isoformat()))
         current_date = datetime.now()
+        created_date = datetime.fromisoformat(card.get('dateLastActivity', current_date.isoformat()))
         total_cycle_time = current_date - created_date
 
         return {
@@ -260,32 +461,38 @@ class KanbanAutomation:
 
     async def apply_wip_limits(self, limits: Dict[str, int]):
         """Apply Work-In-Progress limits to lists."""
-        for stage, limit in limits.items():
-            if stage not in self.stage_lists:
-                continue
+        stages = [(stage, limit) for stage, limit in limits.items()
+                  if stage in self.stage_lists]
 
-            # Get cards in this list
-            cards = await self.trello.call_tool('get_cards_by_list_id', {
+        # Get cards in every limited list at once
+        card_batches = await asyncio.gather(*(
+            self.trello.call_tool('get_cards_by_list_id', {
                 'listId': self.stage_lists[stage]
             })
+            for stage, _ in stages
+        ))
 
-            if len(cards) > limit:
-                # Create warning card
-                await self.trello.call_tool('add_card_to_list', {
-                    'listId': self.stage_lists[stage],
-                    'name': f'⚠️ WIP LIMIT EXCEEDED',
-                    'description': f"""## WIP Limit Violation
-
-The **{stage}** column has exceeded its WIP limit.
-
-- **Current cards**: {len(cards)}
-- **WIP Limit**: {limit}
-- **Excess**: {len(cards) - limit}
+        violations = [
+            (stage, limit, len(cards))
+            for (stage, limit), cards in zip(stages, card_batches)
+            if len(cards) > limit
+        ]
 
-### Action Required
-Please complete work in progress before pulling new items.""",
-                    'labels': ['warning', 'wip-violation']
-                })
+        # Create warning cards
+        await asyncio.gather(*(
+            self.trello.call_tool('add_card_to_list', {
+                'listId': self.stage_lists[stage],
+                'name': f'⚠️ WIP LIMIT EXCEEDED',
+                'description': _WIP_VIOLATION_TMPL.format(
+                    stage=stage,
+                    count=count,
+                    limit=limit,
+                    excess=count - limit
+                ),
+                'labels': ['warning', 'wip-violation']
+            })
+            for stage, limit, count in violations
+        ))
 
 
 # Example 4: Retrospective Management
@@ -305,8 +512,9 @@ class RetroManager:
             "Kudos": "blue"
         }
 
+        # Lists are appended in creation order, so create them one at a time
         list_ids = {}
-        for list_name, color in retro_lists.items():
+        for list_name in retro_lists:
             list_data = await self.trello.call_tool('add_list_to_board', {
                 'name': f"Sprint {sprint_number} - {list_name}"
             })
@@ -338,7 +546,7 @@ class RetroManager:
     async def add_retro_item(self, list_name: str, title: str,
                             description: str, votes: int = 0):
         """Add an item to the retrospective."""
-        lists = await self.trello.call_tool('get_lists')
+        lists = await self.trello.get_lists_cached()
         target_list = None
 
         for lst in lists:
@@ -365,15 +573,18 @@ class RetroManager:
     async def convert_to_action_items(self, retro_cards: List[str],
                                      target_board_id: str):
         """Convert retrospective items to actionable tasks."""
-        action_items = []
+        now_iso = datetime.now().isoformat()
 
-        for card_id in retro_cards:
-            # Get card details
-            card = await self.trello.call_tool('get_card', {
-                'cardId': card_id
-            })
+        # Get card details
+        cards = await asyncio.gather(*(
+            self.trello.call_tool('get_card', {'cardId': card_id})
+            for card_id in retro_cards
+        ))
 
-            # Create action item in target board
+        # Create action items in target board one at a time: add_card_to_list
+        # appends without a position, so sequential creation keeps retro order
+        action_items = []
+        for card in cards:
             action_card = await self.trello.call_tool('add_card_to_list', {
                 'boardId': target_board_id,
                 'listId': 'backlog-list-id',  # Would be fetched dynamically
@@ -392,7 +603,7 @@ class RetroManager:
 - [ ] Team informed
 - [ ] Documentation updated
 
-**Created from retro**: {datetime.now().isoformat()}""",
+**Created from retro**: {now_iso}""",
                 'labels': ['retro-action', 'improvement']
             })
 
@@ -408,9 +619,22 @@ class ProjectAnalytics:
     def __init__(self, trello_client: TrelloMCPClient):
         self.trello = trello_client
 
-    async def generate_burndown_data(self) -> Dict:
+    async def collect_board_snapshot(self) -> Dict:
+        """Fetch the board's lists and every list's cards once for reuse by the reports."""
+        lists = await self.trello.get_lists_cached()
+        card_batches = await asyncio.gather(*(
+            self.trello.get_list_cards(lst['id'], _ANALYTICS_CARD_FIELDS)
+            for lst in lists
+        ))
+        return {
+            'lists': lists,
+            'cards_by_list': {lst['id']: cards for lst, cards in zip(lists, card_batches)}
+        }
+
+    async def generate_burndown_data(self, snapshot: Optional[Dict] = None) -> Dict:
         """Generate data for a burndown chart."""
-        lists = await self.trello.call_tool('get_lists')
+        snapshot = snapshot or await self.collect_board_snapshot()
+        lists = snapshot['lists']
 
         burndown_data = {
             'date': datetime.now().isoformat(),
@@ -421,22 +645,12 @@ class ProjectAnalytics:
         }
 
         for lst in lists:
-            cards = await self.trello.call_tool('get_cards_by_list_id', {
-                'listId': lst['id']
-            })
-
-            list_points = 0
-            for card in cards:
-                # Extract story points from card name (e.g., "[5] Feature Name")
-                import re
-                points_match = re.match(r'\[(\d+)\]', card.get('name', ''))
-                if points_match:
-                    points = int(points_match.group(1))
-                    list_points += points
-                    burndown_data['total_points'] += points
+            cards = snapshot['cards_by_list'][lst['id']]
+            list_points = sum(_story_points(card) for card in cards)
+            burndown_data['total_points'] += list_points
 
-                    if lst['name'] in ['Done', 'Completed', 'Deployed']:
-                        burndown_data['completed_points'] += points
+            if lst['name'] in _DONE_LISTS:
+                burndown_data['completed_points'] += list_points
 
             burndown_data['by_list'][lst['name']] = list_points
 
@@ -446,7 +660,8 @@ class ProjectAnalytics:
 
         return burndown_data
 
-    async def team_velocity_report(self, sprints: int = 3) -> Dict:
+    async def team_velocity_report(self, sprints: int = 3,
+                                   snapshot: Optional[Dict] = None) -> Dict:
         """Calculate team velocity over recent sprints."""
         velocity_data = {
             'sprints': [],
@@ -455,34 +670,33 @@ class ProjectAnalytics:
         }
 
         # This would typically look at archived cards with sprint labels
-        lists = await self.trello.call_tool('get_lists')
+        if snapshot:
+            lists = snapshot['lists']
+        else:
+            lists = await self.trello.get_lists_cached()
         done_list = None
 
         for lst in lists:
-            if lst['name'] in ['Done', 'Completed']:
+            if lst['name'] in _VELOCITY_DONE_LISTS:
                 done_list = lst['id']
                 break
 
         if done_list:
-            cards = await self.trello.call_tool('get_cards_by_list_id', {
-                'listId': done_list
-            })
+            if snapshot:
+                cards = snapshot['cards_by_list'][done_list]
+            else:
+                cards = await self.trello.get_list_cards(done_list, _ANALYTICS_CARD_FIELDS)
 
             # Group cards by sprint (simplified - would use labels/dates in practice)
             sprint_points = {}
             for card in cards:
+                points = _story_points(card)
+
                 # Extract sprint number from labels
                 for label in card.get('labels', []):
                     if 'sprint-' in label.get('name', '').lower():
                         sprint_num = label['name'].split('-')[1]
-                        if sprint_num not in sprint_points:
-                            sprint_points[sprint_num] = 0
-
-                        # Extract story points
-                        import re
-                        points_match = re.match(r'\[(\d+)\]', card.get('name', ''))
-                        if points_match:
-                            sprint_points[sprint_num] += int(points_match.group(1))
+                        sprint_points[sprint_num] = sprint_points.get(sprint_num, 0) + points
 
             # Calculate average
             if sprint_points:
@@ -498,10 +712,13 @@ class ProjectAnalytics:
 
         return velocity_data
 
-    async def generate_health_metrics(self) -> Dict:
+    async def generate_health_metrics(self, snapshot: Optional[Dict] = None) -> Dict:
         """Generate overall project health metrics."""
+        snapshot = snapshot or await self.collect_board_snapshot()
+        # Trello timestamps are UTC; compare in UTC but report local time like the other reports
+        now = datetime.now(timezone.utc)
         metrics = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.astimezone().replace(tzinfo=None).isoformat(),
             'lists': {},
             'overdue_cards': [],
             'blocked_cards': [],
@@ -510,14 +727,12 @@ class ProjectAnalytics:
             'health_score': 100
         }
 
-        lists = await self.trello.call_tool('get_lists')
-        now = datetime.now()
-
-        for lst in lists:
-            cards = await self.trello.call_tool('get_cards_by_list_id', {
-                'listId': lst['id']
-            })
+        # Compare raw epoch seconds; (now - last_activity).days > 14 means 15+ days
+        now_ts = now.timestamp()
+        stale_cutoff = now_ts - 15 * 86400
 
+        for lst in snapshot['lists']:
+            cards = snapshot['cards_by_list'][lst['id']]
             metrics['lists'][lst['name']] = {
                 'count': len(cards),
                 'percentage': 0
@@ -526,15 +741,13 @@ class ProjectAnalytics:
 
             for card in cards:
                 # Check for overdue cards
-                if card.get('due'):
-                    due_date = datetime.fromisoformat(card['due'].replace('Z', '+00:00'))
-                    if due_date < now and not card.get('dueComplete'):
+                if card.get('due') and not card.get('dueComplete'):
+                    if _parse_trello_ts(card['due']).timestamp() < now_ts:
                         metrics['overdue_cards'].append({
                             'name': card['name'],
                             'due': card['due'],
                             'list': lst['name']
                         })
-                        metrics['health_score'] -= 5
 
                 # Check for blocked cards
                 if any(label.get('name', '') == 'blocked' for label in card.get('labels', [])):
@@ -542,20 +755,22 @@ class ProjectAnalytics:
                         'name': card['name'],
                         'list': lst['name']
                     })
-                    metrics['health_score'] -= 3
 
                 # Check for stale cards (no activity in 14 days)
                 if card.get('dateLastActivity'):
-                    last_activity = datetime.fromisoformat(
-                        card['dateLastActivity'].replace('Z', '+00:00')
-                    )
-                    if (now - last_activity).days > 14:
+                    if _parse_trello_ts(card['dateLastActivity']).timestamp() <= stale_cutoff:
                         metrics['stale_cards'].append({
                             'name': card['name'],
                             'last_activity': card['dateLastActivity'],
                             'list': lst['name']
                         })
-                        metrics['health_score'] -= 1
+
+        # Deduct 5 per overdue, 3 per blocked and 1 per stale card
+        metrics['health_score'] -= (
+            5 * len(metrics['overdue_cards'])
+            + 3 * len(metrics['blocked_cards'])
+            + len(metrics['stale_cards'])
+        )
 
         # Calculate percentages
         if metrics['total_cards'] > 0:
@@ -574,83 +789,84 @@ class ProjectAnalytics:
 async def main():
     """Example usage of the Trello automation classes."""
 
-    # Initialize client
-    trello = TrelloMCPClient()
-
-    # Task Management Example
-    task_manager = TaskManager(trello)
-    await task_manager.initialize_priority_lists()
-
-    # Create a high-priority task
-    critical_task = Task(
-        name="Fix Production Database Issue",
-        description="Database connection pool exhaustion causing service outages",
-        priority=Priority.CRITICAL,
-        assignee="devops-team",
-        labels=["production", "database", "incident"],
-        checklist_items=[
-            "Identify root cause",
-            "Implement fix",
-            "Test in staging",
-            "Deploy to production",
-            "Monitor for 24 hours"
-        ]
-    )
-
-    card = await task_manager.create_task(critical_task)
-    print(f"Created critical task: {card['id']}")
-
-    # Kanban Automation Example
-    kanban = KanbanAutomation(trello)
-    await kanban.setup_kanban_board()
-
-    # Move card through workflow
-    await kanban.move_card_to_stage(
-        card['id'],
-        "In Progress",
-        "Started investigation into database connection issues"
-    )
-
-    # Apply WIP limits
-    await kanban.apply_wip_limits({
-        "In Progress": 3,
-        "Review": 2,
-        "Testing": 2
-    })
-
-    # Analytics Example
-    analytics = ProjectAnalytics(trello)
-
-    # Generate health metrics
-    health = await analytics.generate_health_metrics()
-    print(f"Project Health Score: {health['health_score']}/100")
-    print(f"Overdue Cards: {len(health['overdue_cards'])}")
-    print(f"Blocked Cards: {len(health['blocked_cards'])}")
-
-    # Generate burndown data
-    burndown = await analytics.generate_burndown_data()
-    print(f"Sprint Progress: {burndown['completed_points']}/{burndown['total_points']} points")
-
-    # Retrospective Example
-    retro = RetroManager(trello)
-    retro_lists = await retro.create_retro_board(sprint_number=23)
-
-    # Add retrospective items
-    await retro.add_retro_item(
-        "What Went Well",
-        "Completed all planned features",
-        "The team delivered all committed user stories for the sprint",
-        votes=8
-    )
-
-    await retro.add_retro_item(
-        "What Could Be Improved",
-        "Better estimation of complex tasks",
-        "Several tasks took longer than estimated, causing end-of-sprint rush",
-        votes=5
-    )
+    # Initialize client; the context manager closes it even if an example fails
+    async with TrelloMCPClient() as trello:
+        # Task Management Example
+        task_manager = TaskManager(trello)
+        await task_manager.initialize_priority_lists()
+
+        # Create a high-priority task
+        critical_task = Task(
+            name="Fix Production Database Issue",
+            description="Database connection pool exhaustion causing service outages",
+            priority=Priority.CRITICAL,
+            assignee="devops-team",
+            labels=["production", "database", "incident"],
+            checklist_items=[
+                "Identify root cause",
+                "Implement fix",
+                "Test in staging",
+                "Deploy to production",
+                "Monitor for 24 hours"
+            ]
+        )
+
+        card = await task_manager.create_task(critical_task)
+        print(f"Created critical task: {card['id']}")
+
+        # Kanban Automation Example
+        kanban = KanbanAutomation(trello)
+        await kanban.setup_kanban_board()
+
+        # Move card through workflow
+        await kanban.move_card_to_stage(
+            card['id'],
+            "In Progress",
+            "Started investigation into database connection issues"
+        )
+
+        # Apply WIP limits
+        await kanban.apply_wip_limits({
+            "In Progress": 3,
+            "Review": 2,
+            "Testing": 2
+        })
+
+        # Analytics Example
+        analytics = ProjectAnalytics(trello)
+
+        # Fetch the board once and reuse it for every report
+        snapshot = await analytics.collect_board_snapshot()
+
+        # Generate health metrics
+        health = await analytics.generate_health_metrics(snapshot)
+        print(f"Project Health Score: {health['health_score']}/100")
+        print(f"Overdue Cards: {len(health['overdue_cards'])}")
+        print(f"Blocked Cards: {len(health['blocked_cards'])}")
+
+        # Generate burndown data
+        burndown = await analytics.generate_burndown_data(snapshot)
+        print(f"Sprint Progress: {burndown['completed_points']}/{burndown['total_points']} points")
+
+        # Retrospective Example
+        retro = RetroManager(trello)
+        retro_lists = await retro.create_retro_board(sprint_number=23)
+
+        # Add retrospective items
+        await retro.add_retro_item(
+            "What Went Well",
+            "Completed all planned features",
+            "The team delivered all committed user stories for the sprint",
+            votes=8
+        )
+
+        await retro.add_retro_item(
+            "What Could Be Improved",
+            "Better estimation of complex tasks",
+            "Several tasks took longer than estimated, causing end-of-sprint rush",
+            votes=5
+        )
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
\ No newline at end of file